@@ -1,30 +1,68 @@
 #!/usr/bin/env python3
 
 """
-BitcoinRPCClient is an asynchronous client for communicating with a lib BitcoinRPC.
+BitcoinRPCClient is an asynchronous client for communicating with a Bitcoin Core node via JSON-RPC.
 """
 
 import asyncio
-from typing import Any, Literal, Optional
+import functools
+from collections.abc import Callable, Coroutine
+from typing import Any, Optional, ParamSpec, TypeVar
 
-import httpx
-from bitcoinrpc import BitcoinRPC  # type: ignore
-from dotenv import dotenv_values
+import aiohttp
 
-config = dotenv_values("env/BitcoinRPC.env")
+from bitcoin_core import BitcoinCoreClient, close_all
 
+P = ParamSpec("P")
+T = TypeVar("T")
 
-class BitcoinRPCClient:
+# Failures of the node or the transport, programming errors propagate as is
+_RPC_ERRORS = (aiohttp.ClientError, RuntimeError, TimeoutError)
+
+
+def _rpc(
+    method: str,
+) -> Callable[
+    [Callable[P, Coroutine[Any, Any, T]]], Callable[P, Coroutine[Any, Any, T]]
+]:
+    """
+    Decorator wrapping the RPC and HTTP errors of a method into a RuntimeError naming it.
+
+    asyncio.CancelledError is a BaseException, so cancellations and timeouts
+    of the caller propagate untouched.
+
+    :param method: The name of the RPC method, used in the error message
+    :type method: str
+    """
+
+    def deco(
+        fn: Callable[P, Coroutine[Any, Any, T]],
+    ) -> Callable[P, Coroutine[Any, Any, T]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            try:
+                return await fn(*args, **kwargs)
+            except _RPC_ERRORS as e:
+                raise RuntimeError(f"Error calling RPC method '{method}': {e}") from e
+
+        return wrapper
+
+    return deco
+
+
+class BitcoinRPCClient(BitcoinCoreClient):
     """
     Client async to comunication with BitcoinRPC.
 
-    Implementation the pattern Wrapper on the BitcoinRPC library with manager automatic concection through context manager.
+    Thin wrapper on BitcoinCoreClient, sharing its aiohttp session and JSON-RPC transport, with manager automatic concection through context manager.
 
     Use:
         async with BitcoinRPCClient(...) as client:
             block = await client.get_block_by_hash(block_hash)
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         rcp_user: Optional[str] = None,
@@ -44,54 +82,14 @@ class BitcoinRPCClient:
         :param rcp_port: Port for RPC connection
         :type rcp_port: Optional[str]
         """
-        self._host = rcp_host or config["RPC_HOST"]
-        self._port = rcp_port or config["RPC_PORT"]
-        self._username = rcp_user or config["RPC_USER"]
-        self._password = rcp_password or config["RPC_PASSWORD"]
-        self._url = f"http://{self._host}:{self._port}"
-
         # Conection will start in __aenter__ and close in __aexit__
-        self._btc_con: Optional[BitcoinRPC] = None
-        self._http_client: Optional[httpx.AsyncClient] = None
-
-    async def __aenter__(self) -> "BitcoinRPCClient":
-        """Connect to the Bitcoin RPC server when entering the context."""
-
-        # Create the client AsyncClient for HTTP requests
-        auth_value = (
-            (self._username, self._password)
-            if self._username is not None and self._password is not None
-            else None
-        )
-        self._http_client = httpx.AsyncClient(
-            auth=auth_value,
-            timeout=10.0,
+        super().__init__(
+            rpc_username=rcp_user,
+            rpc_password=rcp_password,
+            rpc_host=rcp_host,
+            rpc_port=int(rcp_port) if rcp_port else None,
         )
 
-        # Create the connection BitcoinRPC using the httpx client
-        self._btc_con = BitcoinRPC(
-            self._url,
-            client=self._http_client,
-        )
-
-        return self
-
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Close the connection to the Bitcoin RPC server when exiting the context."""
-        if self._http_client:
-            await self._http_client.aclose()
-            self._http_client = None
-
-        self._btc_con = None
-
-    # Methods Auxiliares
-    def _ensure_connection(self) -> BitcoinRPC:
-        if not self._btc_con:
-            raise RuntimeError(
-                "BitcoinRPC client is not connected. Use 'async with BitcoinRPCClient(...) as client' to establish a connection."
-            )
-        return self._btc_con
-
     async def acall_rpc(self, method: str, *args) -> Any:
         """
         Call a generic RPC method with the provided arguments.
@@ -101,14 +99,14 @@ class BitcoinRPCClient:
         :param args: Arguments to pass to the RPC method
         :type args: Any
         """
-        conn = self._ensure_connection()
         try:
-            return await conn.acall(method, *args)
-        except Exception as e:
-            raise RuntimeError(f"Error calling RPC method '{method}': {e}")
+            return await self._handle_request(method, *args)
+        except _RPC_ERRORS as e:
+            raise RuntimeError(f"Error calling RPC method '{method}': {e}") from e
 
     # Methods to interact with the Bitcoin network RPC
 
+    @_rpc("getmininginfo")
     async def getmininginfo(self) -> dict[str, Any]:
         """
         Returns a json object containing mining-related information.
@@ -133,12 +131,9 @@ class BitcoinRPCClient:
             }
         """
 
-        conn = self._ensure_connection()
-        try:
-            return await conn.getmininginfo()  # type: ignore
-        except Exception as e:
-            raise RuntimeError(f"Error calling RPC method 'getmininginfo': {e}")
+        return await super().getmininginfo()
 
+    @_rpc("getblockchaininfo")
     async def getblockchaininfo(self) -> dict[str, Any]:
         """
         Returns an object containing various state info regarding blockchain processing.
@@ -165,12 +160,9 @@ class BitcoinRPCClient:
             }
         """
 
-        conn = self._ensure_connection()
-        try:
-            return await conn.getblockchaininfo()  # type: ignore
-        except Exception as e:
-            raise RuntimeError(f"Error calling RPC method 'getblockchaininfo': {e}")
+        return await super().getblockchaininfo()
 
+    @_rpc("getbestblockhash")
     async def getbestblockhash(self) -> str:
         """
         Returns the hash of the best (tip) block in the most-work fully-validated chain.
@@ -178,15 +170,9 @@ class BitcoinRPCClient:
             '00000000000000000001dc83907b6c66df6518879c83cec53b86d5b306df4786'
         """
 
-        conn = self._ensure_connection()
-        try:
-            # Example: await conn.acall("getbestblockhash", [])
-            # return await conn.getbestblockhash()
-            return await conn.acall("getbestblockhash", [])
-
-        except Exception as e:
-            raise RuntimeError(f"Error calling RPC method 'getbestblockhash': {e}")
+        return await super().getbestblockhash()
 
+    @_rpc("getdifficulty")
     async def getdifficulty(self) -> float:
         """
         Returns the proof-of-work difficulty as a multiple of the minimum difficulty.
@@ -197,14 +183,10 @@ class BitcoinRPCClient:
             type: float
         """
 
-        conn = self._ensure_connection()
-        try:
-            return await conn.getdifficulty()
-
-        except Exception as e:
-            raise RuntimeError(f"Error calling RPC method 'getdifficulty': {e}")
+        return await super().getdifficulty()
 
-    async def getblock(self, blockhash: str, verbosity: Literal[0, 1, 2] = 1) -> Any:
+    @_rpc("getblock")
+    async def getblock(self, blockhash: str, verbosity: int = 1) -> Any:
         """
         Return info for a block.
 
@@ -216,18 +198,13 @@ class BitcoinRPCClient:
         :rtype: Any
         """
 
-        conn = self._ensure_connection()
-        try:
-            return await conn.getblock(blockhash, verbosity)
-
-        except Exception as e:
-            raise RuntimeError(f"Error calling RPC method 'getblock': {e}")
+        return await super().getblock(blockhash, verbosity)
 
     # Methods Property
     @property
     def is_connected(self) -> bool:
         """Check if the client is connected to the Bitcoin RPC server."""
-        return self._btc_con is not None
+        return self._session is not None and not self._session.closed
 
     @property
     def url(self) -> str:
@@ -236,16 +213,19 @@ class BitcoinRPCClient:
 
 
 async def main():
-    async with BitcoinRPCClient() as client:
-        # mining_info = await client.getblock(
-        #     "0000000000000000000181222b70dee865fe59a572fc7bb2038f077cd293fd77"
-        # )
-
-        mining_info = await client.getmininginfo()
-        print(mining_info)
-
-        print(client.is_connected)
-        print(client.url)
+    try:
+        async with BitcoinRPCClient() as client:
+            # mining_info = await client.getblock(
+            #     "0000000000000000000181222b70dee865fe59a572fc7bb2038f077cd293fd77"
+            # )
+
+            mining_info = await client.getmininginfo()
+            print(mining_info)
+
+            print(client.is_connected)
+            print(client.url)
+    finally:
+        await close_all()
 
 
 if __name__ == "__main__":
@@ -4,15 +4,180 @@
 BitcoinCorelient is an asynchronous client for communicating with a Bitcoin Core node via JSON-RPC.
 """
 
+import asyncio
 import base64
+import functools
+import logging
+import time
+import weakref
+from collections import OrderedDict
 from typing import Any, Optional
 
 import aiohttp
+import ijson  # type: ignore
+import orjson
 from dotenv import dotenv_values
+from mypy_extensions import mypyc_attr
 
 config = dotenv_values("env/BitcoinRPC.env")
 
+logger = logging.getLogger(__name__)
 
+# Sessions shared by all the clients of an event loop, keyed by RPC URL
+_SESSIONS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, aiohttp.ClientSession]
+] = weakref.WeakKeyDictionary()
+
+# Mining calls worth retrying when bitcoind drops a kept-alive connection
+RETRY_ON_DISCONNECT = frozenset({"getblocktemplate", "submitblock"})
+
+# HTTP statuses of a server (or proxy) that does not accept JSON-RPC batches
+BATCH_REJECTED_STATUS = frozenset({400, 404, 405})
+
+# Blocks this deep below the tip are considered safe from reorgs
+REORG_DEPTH = 6
+
+# Seconds a block hash near the tip is reused before asking the node again
+RECENT_HASH_TTL = 30.0
+
+# Block hashes near the tip kept per client, the least recently used go first
+RECENT_HASH_MAX = 256
+
+# Size of a serialized block header, as returned by the REST headers endpoint
+HEADER_SIZE = 80
+
+# Scalar fields of getblocktemplate kept by getblocktemplate_summary
+_TEMPLATE_SUMMARY_FIELDS = {
+    "result.bits": "bits",
+    "result.previousblockhash": "previousblockhash",
+    "result.coinbasevalue": "coinbasevalue",
+    "result.height": "height",
+}
+
+
+def _build_auth_header(user: Optional[str], password: Optional[str]) -> dict[str, str]:
+    """Build the headers for HTTP Basic Auth against the RPC server."""
+    auth_str = f"{user}:{password}"
+    return {
+        "Authorization": f"Basic {base64.b64encode(auth_str.encode()).decode()}",
+        "Content-Type": "application/json",
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _defaults() -> tuple[
+    Optional[str], int, Optional[str], Optional[str], dict[str, str]
+]:
+    """
+    Resolve the connection defaults from env/BitcoinRPC.env once per process.
+
+    :return: The host, port, user, password and the auth headers built from them
+    :rtype: tuple[Optional[str], int, Optional[str], Optional[str], dict[str, str]]
+    """
+    user = config.get("RPC_USER")
+    password = config.get("RPC_PASSWORD")
+    return (
+        config.get("RPC_HOST"),
+        int(config.get("RPC_PORT") or 8332),
+        user,
+        password,
+        _build_auth_header(user, password),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _envelope(method: str) -> bytes:
+    """
+    Pre-serialize the constant part of the request object of a method.
+
+    The request is completed by appending the serialized params and b"}".
+
+    :param method: The RPC method to call
+    :type method: str
+    :return: The JSON-RPC request object up to the "params" value
+    :rtype: bytes
+    """
+    return (
+        b'{"jsonrpc":"2.0","id":"miner-python-client","method":'
+        + orjson.dumps(method)
+        + b',"params":'
+    )
+
+
+def _new_session() -> aiohttp.ClientSession:
+    """
+    Open a session with a keep-alive pool for a single bitcoind endpoint.
+
+    Idle sockets are dropped before bitcoind's own rpcservertimeout (30s by
+    default) does it, since the node closes them without a clean FIN.
+    Credentials and timeouts are sent per request, so any client can share it.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=0,
+        limit_per_host=32,
+        keepalive_timeout=25,
+        ttl_dns_cache=300,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+async def close_all() -> None:
+    """
+    Close the sessions shared by the clients of the running event loop.
+
+    Clients leave their session open when exiting the context, so call it once
+    before the loop ends, e.g. at the end of the coroutine given to asyncio.run.
+    """
+    sessions = _SESSIONS.pop(asyncio.get_running_loop(), {})
+    for session in sessions.values():
+        await session.close()
+
+
+class _LRU:
+    """Bounded map dropping the least recently used entry when full."""
+
+    __slots__ = ("_data", "_maxsize")
+
+    def __init__(self, maxsize: int) -> None:
+        self._data: OrderedDict[Any, Any] = OrderedDict()
+        self._maxsize = maxsize
+
+    def get(self, key: Any) -> Any:
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def put(self, key: Any, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+# Answers that never change, shared by every client of the process. Blocks
+# and headers are keyed by (method, hash, verbosity), block hashes by
+# (url, height) since a height maps to different blocks on different nodes.
+# Only verbosity 1 blocks are kept (a few hundred KB each as JSON), a
+# verbosity 2 block can weigh several MB.
+_BLOCKS = _LRU(64)
+_HEADERS = _LRU(4096)
+_BURIED_HASHES = _LRU(4096)
+
+
+def unwrap_batch(results: list[Any]) -> list[Any]:
+    """Raise the first error collected by a batch call, or return the results."""
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+    return results
+
+
+# BitcoinRPCClient (interpreted) subclasses it when this module is compiled
+@mypyc_attr(allow_interpreted_subclasses=True)
 class BitcoinCoreClient:
     """
     Client async to comunication with Bitcoin Core via JSON-RPC.
@@ -21,15 +186,36 @@ class BitcoinCoreClient:
     Use:
         async with BitcoinCoreClient(...) as client:
             block = await client.get_block_by_hash(block_hash)
+
+    The aiohttp session is shared by the clients of an event loop and stays open when the context exits, so call close_all() once before the loop ends (e.g. in a finally block), or the connector is left unclosed.
+
+    Prefer batch_call over manual asyncio.create_task fan-out for many small RPCs: it costs one HTTP round-trip and one coroutine instead of a Task (and an extra loop iteration) per call.
     """
 
+    __slots__ = (
+        "_rpc_user",
+        "_rpc_password",
+        "_rpc_host",
+        "_rpc_port",
+        "_url",
+        "_auth_header",
+        "_concurrency",
+        "_sem",
+        "_batch_rejected",
+        "_tip",
+        "_recent_hashes",
+        "_session",
+        "_timeout",
+    )
+
     def __init__(
         self,
         rpc_username: Optional[str] = None,
         rpc_password: Optional[str] = None,
         rpc_host: Optional[str] = None,
         rpc_port: Optional[int] = None,
-        timeout: Optional[int] = 10,
+        timeout: int = 10,
+        concurrency: int = 16,
     ) -> None:
         """
         Initialize the Bitcoin Core Client with credenciais RPC.
@@ -42,40 +228,66 @@ class BitcoinCoreClient:
         :type rpc_host: Optional[str]
         :param rpc_port: Port for RPC connection
         :type rpc_port: Optional[int]
+        :param timeout: Timeout in seconds for each RPC call
+        :type timeout: int
+        :param concurrency: Maximum number of HTTP requests in flight to the node
+        :type concurrency: int
         """
-        self._rpc_user = rpc_username or config.get("RPC_USER")
-        self._rpc_password = rpc_password or config.get("RPC_PASSWORD")
-        self._rpc_host = rpc_host or config.get("RPC_HOST")
-        self._rpc_port = rpc_port or int(config.get("RPC_PORT", 8332))  # type: ignore
+        host, port, user, password, auth_header = _defaults()
+        self._rpc_user = rpc_username or user
+        self._rpc_password = rpc_password or password
+        self._rpc_host = rpc_host or host
+        self._rpc_port = rpc_port or port
         self._url = f"http://{self._rpc_host}:{self._rpc_port}"
 
-        # Prepare authentication for header HTTP Basic Auth
-        auth_str = f"{self._rpc_user}:{self._rpc_password}"
-        # self._auth_header = {"Authorization": f"Basic {auth_str.encode('utf-8').hex()}"}
-        self._auth_header = {
-            "Authorization": f"Basic {base64.b64encode(auth_str.encode()).decode()}",
-            "Content-Type": "application/json",
-        }
+        # Prepare authentication for header HTTP Basic Auth, only encoded again
+        # when the credentials differ from the env defaults
+        if rpc_username or rpc_password:
+            auth_header = _build_auth_header(self._rpc_user, self._rpc_password)
+        self._auth_header = auth_header
+
+        # Backpressure: bitcoind has a small RPC work queue and drops connections
+        # without a clean FIN when it overflows
+        self._concurrency = concurrency
+        self._sem = asyncio.Semaphore(concurrency)
+
+        # Set once the server (or a proxy in front of it) refuses JSON-RPC batches
+        self._batch_rejected = False
+
+        # Last block count seen, used to tell which heights are safe to cache
+        self._tip: Optional[int] = None
+        # height -> (expires_at, hash) for heights not yet safe from reorgs,
+        # bounded since every height goes there while the tip is unknown
+        self._recent_hashes = _LRU(RECENT_HASH_MAX)
 
         self._session: Optional[aiohttp.ClientSession] = None
-        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._timeout = aiohttp.ClientTimeout(
+            total=timeout, sock_connect=3, sock_read=timeout
+        )
 
     async def __aenter__(self) -> "BitcoinCoreClient":
         """Connect to the Bitcoin RPC server when entering the context."""
 
         if not self._session or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                headers=self._auth_header, timeout=self._timeout
-            )
+            sessions = _SESSIONS.setdefault(asyncio.get_running_loop(), {})
+            session = sessions.get(self._url)
+            # No await between the lookup and the insert, so two clients of the
+            # same loop can't both open a session for the URL
+            if session is None or session.closed:
+                session = _new_session()
+                sessions[self._url] = session
+            self._session = session
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Close the connection to the Bitcoin RPC server when exiting the context."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        """
+        Release the connection to the Bitcoin RPC server when exiting the context.
 
-    async def _handle_request(self, method: str, *args, **kwargs) -> dict[str, Any]:
+        The shared session stays open for the next clients, see close_all().
+        """
+        self._session = None
+
+    async def _handle_request(self, method: str, *args, **kwargs) -> Any:
         """
         Internal method to perform an asynchronous RPC call to the Bitcoin Core node.
 
@@ -84,35 +296,281 @@ class BitcoinCoreClient:
         :param params: The parameters for the RPC call
         :type params: list
         :return: The result of the RPC call
+        :rtype: Any
+        """
+        if not self._session:
+            raise RuntimeError(
+                "Client session is not initialized. Use 'async with' to manage the connection."
+            )
+
+        params = [kwargs] if kwargs else list(args)
+
+        logger.debug("rpc %s", method)
+
+        # orjson instead of the stdlib json: getblock/getblocktemplate answers can
+        # be several MB and parsing them is the main CPU cost of a call.
+        # Only the params are serialized per call, the envelope is cached.
+        body = _envelope(method) + orjson.dumps(params) + b"}"
+
+        retries = 1 if method in RETRY_ON_DISCONNECT else 0
+        while True:
+            try:
+                async with (
+                    self._sem,
+                    self._session.post(
+                        self._url,
+                        data=body,
+                        headers=self._auth_header,
+                        timeout=self._timeout,
+                    ) as response,
+                ):
+                    response.raise_for_status()
+                    result = orjson.loads(await response.read())
+                    if "error" in result and result["error"] is not None:
+                        raise RuntimeError(f"RPC Error: {result['error']}")
+                    return result["result"]
+            except aiohttp.ServerDisconnectedError as e:
+                # The stale connection is discarded by the pool, so the retry
+                # goes out on a freshly opened one
+                if not retries:
+                    raise RuntimeError(f"HTTP error during RPC call: {e}") from e
+                retries -= 1
+            except aiohttp.ClientError as e:
+                raise RuntimeError(f"HTTP error during RPC call: {e}") from e
+
+    def _build_single(self, method: str, params: list, id_: Any) -> dict[str, Any]:
+        """
+        Build the JSON-RPC request object for a single call.
+
+        :param method: The RPC method to call
+        :type method: str
+        :param params: The positional or named parameters for the RPC call
+        :type params: list
+        :param id_: The request id, echoed back by the server in the response
+        :type id_: Any
+        :return: The JSON-RPC request object
         :rtype: dict[str, Any]
         """
+        return {"jsonrpc": "2.0", "method": method, "params": params, "id": id_}
+
+    async def batch_call(self, calls: list[tuple[str, list]]) -> list[Any]:
+        """
+        Perform several RPC calls in a single HTTP round-trip using a JSON-RPC batch.
+
+        A failing call does not abort the batch: its position in the returned list
+        holds a RuntimeError instead of a result, like asyncio.gather(return_exceptions=True).
+        When the server does not accept batches, the calls are sent concurrently one by one instead.
+
+        Use:
+            header, info = await client.batch_call(
+                [("getblockheader", [block_hash, True]), ("getmininginfo", [])]
+            )
+
+        :param calls: Pairs of (method, params) to send in the batch
+        :type calls: list[tuple[str, list]]
+        :return: The results in the same order as calls
+        :rtype: list[Any]
+        """
         if not self._session:
             raise RuntimeError(
                 "Client session is not initialized. Use 'async with' to manage the connection."
             )
 
-        params = list(args) if args else []
-        params = [{key: val for key, val in kwargs.items()}] if len(kwargs) else params
+        if not calls:
+            return []
 
-        payload = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params,
-            "id": "miner-python-client",
-        }
+        if self._batch_rejected:
+            return await self._gather_calls(calls)
 
-        # print(f"Preparing RPC call: {method} with args: {args} and kwargs: {kwargs}")
-        # print(f"Making RPC call: {method} with params: {payload['params']}")
+        payload = [
+            self._build_single(method, params, id_)
+            for id_, (method, params) in enumerate(calls)
+        ]
+        logger.debug("rpc batch of %d calls", len(payload))
+
+        body = orjson.dumps(payload)
 
         try:
-            async with self._session.post(self._url, json=payload) as response:
+            async with (
+                self._sem,
+                self._session.post(
+                    self._url,
+                    data=body,
+                    headers=self._auth_header,
+                    timeout=self._timeout,
+                ) as response,
+            ):
                 response.raise_for_status()
-                result = await response.json()
-                if "error" in result and result["error"] is not None:
-                    raise RuntimeError(f"RPC Error: {result['error']}")
-                return result["result"]
+                replies = orjson.loads(await response.read())
+        except aiohttp.ClientResponseError as e:
+            if e.status not in BATCH_REJECTED_STATUS:
+                raise RuntimeError(f"HTTP error during RPC batch call: {e}") from e
+            replies = None
         except aiohttp.ClientError as e:
-            raise RuntimeError(f"HTTP error during RPC call: {e}")
+            raise RuntimeError(f"HTTP error during RPC batch call: {e}") from e
+        except orjson.JSONDecodeError as e:
+            raise RuntimeError(f"Invalid JSON in RPC batch response: {e}") from e
+
+        # Only a refusal of the batch itself is remembered, transient errors
+        # (5xx, dropped connections) are raised and the next batch is tried again
+        if not isinstance(replies, list):
+            logger.debug("rpc batch rejected, falling back to single calls")
+            self._batch_rejected = True
+            return await self._gather_calls(calls)
+
+        # The server may answer in any order, the id is the index of the call
+        results: list[Any] = [None] * len(calls)
+        answered = [False] * len(calls)
+        for reply in replies:
+            id_ = reply.get("id") if isinstance(reply, dict) else None
+            if not isinstance(id_, int) or not 0 <= id_ < len(calls):
+                logger.debug("rpc batch reply with unknown id %r ignored", id_)
+                continue
+            answered[id_] = True
+            if reply.get("error") is not None:
+                results[id_] = RuntimeError(
+                    f"RPC Error in '{calls[id_][0]}': {reply['error']}"
+                )
+            else:
+                results[id_] = reply["result"]
+        for id_, ok in enumerate(answered):
+            if not ok:
+                results[id_] = RuntimeError(
+                    f"RPC Error in '{calls[id_][0]}': no reply in the batch"
+                )
+        return results
+
+    async def _gather_calls(self, calls: list[tuple[str, list]]) -> list[Any]:
+        """Send the calls of a batch concurrently as single requests."""
+        return await asyncio.gather(
+            *(self._handle_request(method, *params) for method, params in calls),
+            return_exceptions=True,
+        )
+
+    async def gather_headers(self, hashes: list[str]) -> list[Any]:
+        """
+        Get the verbose block headers of several blocks in a single batch call.
+
+        :param hashes: The hashes of the block headers to retrieve
+        :type hashes: list[str]
+        :return: The block headers (or RuntimeError) in the same order as hashes
+        :rtype: list[Any]
+        """
+
+        return await self.batch_call([("getblockheader", [h, True]) for h in hashes])
+
+    async def getblockheaders_bin(self, hash: str, count: int) -> bytes:
+        """
+        Get up to count serialized block headers of the active chain, starting at hash, from the REST interface.
+
+        Needs bitcoind running with -rest. The headers come back as raw 80-byte
+        records, against about 500 bytes of JSON each from getblockheader, and
+        the node answers at most 2000 of them per request.
+        Uses the /rest/headers/<hash>.bin?count=<count> form of Bitcoin Core 24+,
+        the older /rest/headers/<count>/<hash>.bin is deprecated.
+
+        :param hash: The hash of the first block header to retrieve
+        :type hash: str
+        :param count: The number of block headers to retrieve
+        :type count: int
+        :return: The headers concatenated, HEADER_SIZE bytes each
+        :rtype: bytes
+        """
+        if not self._session:
+            raise RuntimeError(
+                "Client session is not initialized. Use 'async with' to manage the connection."
+            )
+
+        try:
+            async with (
+                self._sem,
+                self._session.get(
+                    f"{self._url}/rest/headers/{hash}.bin",
+                    params={"count": count},
+                    timeout=self._timeout,
+                ) as response,
+            ):
+                response.raise_for_status()
+                return await response.read()
+        except aiohttp.ClientError as e:
+            raise RuntimeError(f"HTTP error during REST call: {e}") from e
+
+    async def snapshot(self) -> dict[str, Any]:
+        """
+        Get the mining info, blockchain info and difficulty in a single batch call.
+
+        :return: The results under the keys "mining", "chain" and "diff"
+        :rtype: dict[str, Any]
+        """
+        mining, chain, diff = unwrap_batch(
+            await self.batch_call(
+                [
+                    ("getmininginfo", []),
+                    ("getblockchaininfo", []),
+                    ("getdifficulty", []),
+                ]
+            )
+        )
+
+        return {"mining": mining, "chain": chain, "diff": diff}
+
+    async def tip_snapshot(self) -> dict[str, Any]:
+        """
+        Get the tip block hash, its header and block, and the mining info.
+
+        Only the header and block depend on the tip hash; they are fetched in one
+        batch together with getmininginfo, so the snapshot costs 2 round-trips
+        instead of 4.
+
+        :return: The results under the keys "hash", "header", "block" and "mining"
+        :rtype: dict[str, Any]
+        """
+        tip = await self.getbestblockhash()
+        header, block, mining = unwrap_batch(
+            await self.batch_call(
+                [
+                    ("getblockheader", [tip, True]),
+                    ("getblock", [tip, 1]),
+                    ("getmininginfo", []),
+                ]
+            )
+        )
+
+        return {"hash": tip, "header": header, "block": block, "mining": mining}
+
+    async def get_headers_range(
+        self, start: int, stop: int, batch_size: int = 100
+    ) -> list[dict[str, Any]]:
+        """
+        Get the verbose block headers for the heights in range(start, stop).
+
+        The block hashes are resolved first and then the headers, each step with
+        batch calls of batch_size requests. Tasks are only created once a slot is
+        free, so a large range never holds more than concurrency pending batches.
+
+        :param start: The first height to retrieve
+        :type start: int
+        :param stop: The height where to stop (exclusive)
+        :type stop: int
+        :param batch_size: The number of RPC calls per batch
+        :type batch_size: int
+        :return: The block headers in height order
+        :rtype: list[dict[str, Any]]
+        """
+
+        async def fan_out(calls: list[tuple[str, list]]) -> list[Any]:
+            sem = asyncio.Semaphore(self._concurrency)
+            tasks = []
+            async with asyncio.TaskGroup() as tg:
+                for i in range(0, len(calls), batch_size):
+                    await sem.acquire()
+                    task = tg.create_task(self.batch_call(calls[i : i + batch_size]))
+                    task.add_done_callback(lambda _: sem.release())
+                    tasks.append(task)
+            return unwrap_batch([result for task in tasks for result in task.result()])
+
+        hashes = await fan_out([("getblockhash", [h]) for h in range(start, stop)])
+        return await fan_out([("getblockheader", [h, True]) for h in hashes])
 
     async def getblocktemplate(self, **kwargs) -> dict[str, Any]:
         """
@@ -126,19 +584,144 @@ class BitcoinCoreClient:
 
         return await self._handle_request("getblocktemplate", **params)
 
-    async def getblock(self, hash: str) -> dict[str, Any]:
+    async def getblocktemplate_summary(self) -> dict[str, Any]:
+        """
+        Get a summary of the block template without building its transactions.
+
+        The response is parsed while it streams in, so the thousands of
+        transaction objects of the template are never materialized.
+
+        :return: The bits, previousblockhash, coinbasevalue and height of the template, its number of transactions (ntx) and the bigger transaction fee in sats (top_fee)
+        :rtype: dict[str, Any]
+        """
+        if not self._session:
+            raise RuntimeError(
+                "Client session is not initialized. Use 'async with' to manage the connection."
+            )
+
+        body = (
+            _envelope("getblocktemplate") + orjson.dumps([{"rules": ["segwit"]}]) + b"}"
+        )
+
+        summary: dict[str, Any] = {}
+        error: dict[str, Any] = {}
+        has_result = False
+        ntx = 0
+        top_fee = 0
+        try:
+            async with (
+                self._sem,
+                self._session.post(
+                    self._url,
+                    data=body,
+                    headers=self._auth_header,
+                    timeout=self._timeout,
+                ) as response,
+            ):
+                response.raise_for_status()
+                async for prefix, event, value in ijson.parse_async(response.content):
+                    if prefix == "result.transactions.item.fee":
+                        ntx += 1
+                        if value > top_fee:
+                            top_fee = value
+                    elif prefix in _TEMPLATE_SUMMARY_FIELDS:
+                        summary[_TEMPLATE_SUMMARY_FIELDS[prefix]] = value
+                    elif prefix == "result" and event == "start_map":
+                        has_result = True
+                    elif prefix.startswith("error."):
+                        error[prefix[6:]] = value
+        except aiohttp.ClientError as e:
+            raise RuntimeError(f"HTTP error during RPC call: {e}") from e
+        except ijson.JSONError as e:
+            raise RuntimeError(f"Invalid JSON in RPC response: {e}") from e
+
+        # e.g. the node is still in initial block download
+        if error:
+            raise RuntimeError(f"RPC Error: {error}")
+        if not has_result:
+            raise RuntimeError("RPC Error: getblocktemplate returned no result")
+
+        summary["ntx"] = ntx
+        summary["top_fee"] = top_fee
+        return summary
+
+    def clear_cache(self) -> None:
+        """
+        Drop the cached blocks, headers and block hashes, e.g. after a reorg.
+
+        The blocks, headers and buried block hashes are shared by every client,
+        so they are cleared for all of them.
+        """
+        _BLOCKS.clear()
+        _HEADERS.clear()
+        _BURIED_HASHES.clear()
+        self._recent_hashes.clear()
+
+    async def _cached(self, cache: _LRU, method: str, hash: str, flag: int) -> Any:
+        """
+        Call a method whose answer only depends on a block hash, through a cache.
+
+        Verbose answers are only kept once the block is REORG_DEPTH deep, where
+        nextblockhash no longer changes, and confirmations is recomputed from
+        the tip on a hit. Entries are stored serialized, so every caller gets
+        its own objects.
+        """
+        key = (method, hash, flag)
+        entry = cache.get(key)
+        if entry is not None:
+            raw, height, tip = entry
+            result = orjson.loads(raw)
+            if isinstance(result, dict):
+                result["confirmations"] = max(tip, self._tip or 0) - height + 1
+            return result
+
+        result = await self._handle_request(method, hash, flag)
+        if not isinstance(result, dict):
+            # Hex-encoded data is fixed by the hash
+            cache.put(key, (orjson.dumps(result), 0, 0))
+            return result
+
+        confirmations = result.get("confirmations", 0)
+        if confirmations >= REORG_DEPTH:
+            height = result["height"]
+            tip = height + confirmations - 1
+            # The answer tells the tip height, worth keeping for getblockhash
+            if self._tip is None or tip > self._tip:
+                self._tip = tip
+            cache.put(key, (orjson.dumps(result), height, tip))
+        return result
+
+    async def getblock(self, hash: str, verbosity: int = 1) -> Any:
         """
         Get a block by its hash from the Bitcoin Core node.
 
         :param hash: The hash of the block to retrieve
         :type hash: str
+        :param verbosity: 0 for hex-encoded block data, 1 for a json object, and 2 for json object with transaction data
+        :type verbosity: int
         :return: The block information
-        :rtype: dict[str, Any]
+        :rtype: Any
+        """
+
+        if verbosity != 1:
+            return await self._handle_request("getblock", hash, verbosity)
+        return await self._cached(_BLOCKS, "getblock", hash, 1)
+
+    async def getbestblockhash(self) -> str:
         """
+        Get the hash of the best (tip) block in the most-work fully-validated chain.
 
-        params = [hash]
+        Command:
+            bitcoin-cli getbestblockhash
+
+        :return: The hash of the tip block
+        :rtype: str
+
+        Return Example Real Data:
+            00000000000000000001dc83907b6c66df6518879c83cec53b86d5b306df4786
+        """
 
-        return await self._handle_request("getblock", *params)
+        return await self._handle_request("getbestblockhash")
 
     async def getblockcount(self) -> int:
         """
@@ -147,10 +730,10 @@ class BitcoinCoreClient:
         :return: The current block count
         :rtype: int
         """
-        result = await self._handle_request("getblockcount")
-        if isinstance(result, (int, str)):
-            return int(result)
-        raise RuntimeError(f"Unexpected result type for getblockcount: {type(result)}")
+        # bitcoind always answers with a JSON number, no conversion needed
+        count = await self._handle_request("getblockcount")
+        self._tip = count
+        return count
 
     async def getmininginfo(self) -> dict[str, Any]:
         """
@@ -197,10 +780,7 @@ class BitcoinCoreClient:
             125864590119494.3
         """
 
-        result = await self._handle_request("getdifficulty")
-        if isinstance(result, (int, float)):
-            return float(result)
-        raise RuntimeError(f"Unexpected result type for getdifficulty: {type(result)}")
+        return await self._handle_request("getdifficulty")
 
     async def getnetworkhashps(self, num_blocks: int = 120) -> float:
         """
@@ -215,12 +795,7 @@ class BitcoinCoreClient:
             1.035436076823005e+21
         """
 
-        result = await self._handle_request("getnetworkhashps", num_blocks)
-        if isinstance(result, (int, float)):
-            return float(result)
-        raise RuntimeError(
-            f"Unexpected result type for getnetworkhashps: {type(result)}"
-        )
+        return await self._handle_request("getnetworkhashps", num_blocks)
 
     async def getblockheader(self, hash: str, verbose: bool = True) -> dict[str, Any]:
         """
@@ -259,7 +834,7 @@ class BitcoinCoreClient:
 
         """
 
-        return await self._handle_request("getblockheader", hash, verbose)
+        return await self._cached(_HEADERS, "getblockheader", hash, bool(verbose))
 
     async def getblockchaininfo(self) -> dict[str, Any]:
         """
@@ -295,20 +870,41 @@ class BitcoinCoreClient:
 
         """
 
-        return await self._handle_request("getblockchaininfo")
+        info = await self._handle_request("getblockchaininfo")
+        self._tip = info["blocks"]
+        return info
 
-    async def getblockhash(self, height: int) -> dict[str, Any]:
+    async def getblockhash(self, height: int) -> str:
         """
-        Get info about the blockchain from the Bitcoin Core node.
+        Get the hash of the block at a height from the Bitcoin Core node.
 
         Command:
             bitcoin-cli getblockhash <height>
 
-        :return: The blockchain information
-        :rtype: dict[str, Any]
+        :param height: The height of the block
+        :type height: int
+        :return: The block hash
+        :rtype: str
 
         Return Example Real Data:
             00000000000000000000e19ae97655f89c430a301d6aa66bf6ab000bd2682524
         """
 
-        return await self._handle_request("getblockhash", height)
+        # The hash at a height only stops changing once buried below the tip
+        if self._tip is not None and height <= self._tip - REORG_DEPTH:
+            key = (self._url, height)
+            buried = _BURIED_HASHES.get(key)
+            if buried is None:
+                buried = await self._handle_request("getblockhash", height)
+                _BURIED_HASHES.put(key, buried)
+            return buried
+
+        # Near the tip (or with the tip unknown) it is only kept for a short TTL
+        now = time.monotonic()
+        cached = self._recent_hashes.get(height)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        block_hash = await self._handle_request("getblockhash", height)
+        self._recent_hashes.put(height, (now + RECENT_HASH_TTL, block_hash))
+        return block_hash
@@ -4,9 +4,62 @@
 BlockAnalyzer is a module for analyzing Bitcoin blocks and transactions.
 """
 
-from typing import Any, List
+import functools
+import operator
+from typing import Any, AsyncIterator, List
 
-from bitcoin_core import BitcoinCoreClient
+import numpy as np
+
+from bitcoin_core import HEADER_SIZE, BitcoinCoreClient, unwrap_batch
+
+# Target of difficulty 1, the numerator of every difficulty
+MAX_TARGET = 0xFFFF * (1 << (8 * (0x1D - 3)))
+_MAX_TARGET_F = float(MAX_TARGET)
+
+# 1 << (8 * (exponent - 3)) for every exponent of a compact target
+_SHIFT_CACHE = {e: 1 << (8 * (e - 3)) for e in range(3, 0x100)}
+
+# Below this many blocks the NumPy setup costs more than the Python loop
+_VECTORIZE_MIN_BLOCKS = 32
+
+# Layout of a serialized block header (HEADER_SIZE bytes), hashes are little-endian
+HEADER_DTYPE = np.dtype(
+    [
+        ("version", "<i4"),
+        ("prev_hash", "V32"),
+        ("merkle_root", "V32"),
+        ("time", "<u4"),
+        ("bits", "<u4"),
+        ("nonce", "<u4"),
+    ]
+)
+
+# Keys of each template entry summary from get_block_template(resume=True)
+_TEMPLATE_FIELDS = (
+    "hash",
+    "target",
+    "height",
+    "difficulty",
+    "bits",
+    "nonce",
+    "tx",
+    "ntx",
+    "size",
+    "weight",
+    "time",
+)
+
+
+def _bits_value(bits: int | str) -> int:
+    """Compact target as an int, bitcoind returns it as a hex string."""
+    return int(bits, 16) if isinstance(bits, str) else bits
+
+
+def _chronological(blocks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Blocks by height when all of them have one, else as given."""
+    if all("height" in block for block in blocks):
+        return sorted(blocks, key=operator.itemgetter("height"))
+    return blocks
 
 
 class BlockAnalyzer:
@@ -18,16 +71,18 @@ class BlockAnalyzer:
         """Initialize the BlockAnalyzer with a Bitcoin Core RPC client."""
         self.rpc_client = rpc_client
 
-    async def get_block_details(self, hash: str) -> dict:
+    async def get_block_details(self, hash: str, verbosity: int = 1) -> dict:
         """
         Get detailed information about a specific block by its hash.
 
         :param hash: The hash of the block to analyze
         :type hash: str
+        :param verbosity: 1 for the txids only, 2 to include the full transaction data (much bigger)
+        :type verbosity: int
         :return: A dictionary containing analysis results of the block
         :rtype: dict
         """
-        return await self.rpc_client.getblock(hash)
+        return await self.rpc_client.getblock(hash, verbosity)
 
     async def get_block_template(
         self, count: int = 10, resume: bool = True
@@ -39,28 +94,15 @@ class BlockAnalyzer:
         :return: A list of dictionaries containing block information
         :rtype: List[dict]
         """
-        blocks = []
         result = await self.rpc_client.getblocktemplate()
-        for block in result["transactions"]:
-            if resume:
-                blocks.append(
-                    {
-                        "hash": block["hash"],
-                        "target": block["target"],
-                        "height": block["height"],
-                        "difficulty": block["difficulty"],
-                        "bits": block["bits"],
-                        "nonce": block["nonce"],
-                        "tx": block["tx"],
-                        "ntx": len(block["tx"]),
-                        "size": block["size"],
-                        "weight": block["weight"],
-                        "time": block["time"],
-                    }
-                )
-            else:
-                blocks.append(block)
-        return blocks[:count]
+        txs = result["transactions"][:count]
+        if not resume:
+            return txs
+        # One dict per entry, ntx is the only computed field
+        return [
+            {k: len(block["tx"]) if k == "ntx" else block[k] for k in _TEMPLATE_FIELDS}
+            for block in txs
+        ]
 
     async def get_recent_blocks(self, count: int = 10) -> list[dict[str, Any]]:
         """
@@ -71,20 +113,74 @@ class BlockAnalyzer:
         :return: A list of recent blocks
         :rtype: list[dict[str, Any]]
         """
+        return [block async for block in self.iter_recent_blocks(count)]
+
+    async def iter_recent_blocks(
+        self, count: int = 10, chunk_size: int = 8
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yield recent blocks from the Bitcoin Core node, starting from the tip.
+
+        The hashes are resolved in one batch call, then the blocks are fetched
+        chunk_size per batch call, so at most one chunk of blocks is held in
+        memory while the caller consumes them.
+
+        :param count: The number of recent blocks to retrieve
+        :type count: int
+        :param chunk_size: The number of blocks fetched per batch call
+        :type chunk_size: int
+        :return: The recent blocks, one at a time
+        :rtype: AsyncIterator[dict[str, Any]]
+        """
         currenty_block = await self.rpc_client.getblockcount()
-        blocks = []
 
-        for i in range(currenty_block, currenty_block - count, -1):
-            block_hash = await self.rpc_client.getblockhash(i)
-            block_info = await self.rpc_client.getblock(block_hash)  # type: ignore
-            # print(
-            #     f"Block {i}: Hash: {block_hash}, Transactions: {len(block_info['tx'])}, Size: {block_info['size']} bytes, Timestamp: {block_info['time']}"
-            # )
-            blocks.append(block_info)
+        hashes = unwrap_batch(
+            await self.rpc_client.batch_call(
+                [
+                    ("getblockhash", [i])
+                    for i in range(currenty_block, currenty_block - count, -1)
+                ]
+            )
+        )
+        for start in range(0, len(hashes), chunk_size):
+            blocks = unwrap_batch(
+                await self.rpc_client.batch_call(
+                    [("getblock", [h, 1]) for h in hashes[start : start + chunk_size]]
+                )
+            )
+            for block in blocks:
+                yield block
+
+    async def get_recent_headers(self, count: int = 10) -> np.ndarray:
+        """
+        Get the headers of the recent blocks in one REST call, oldest first.
+
+        Only the 80-byte headers travel, so thousands of blocks cost a few
+        hundred KB instead of their full JSON. The result is a structured
+        array of HEADER_DTYPE, e.g. bits_to_difficulty_array(headers["bits"])
+        or np.diff(headers["time"].astype(np.int64)). time is unsigned and
+        block timestamps are not monotonic, so cast it before subtracting.
+
+        :param count: The number of recent headers to retrieve, at most 2000
+        :type count: int
+        :return: The recent headers
+        :rtype: np.ndarray
+        """
+        tip = await self.rpc_client.getblockcount()
+        start = max(tip - count + 1, 0)
+        first_hash = await self.rpc_client.getblockhash(start)
 
-        return blocks
+        raw = await self.rpc_client.getblockheaders_bin(first_hash, tip - start + 1)
+        if len(raw) % HEADER_SIZE:
+            raise RuntimeError(
+                f"Truncated REST headers response: {len(raw)} bytes is not a multiple of {HEADER_SIZE}"
+            )
+        return np.frombuffer(raw, dtype=HEADER_DTYPE)
 
-    def bits_to_target(self, bits: int) -> int:
+    # bits only change every 2016 blocks, so a batch of blocks hits the caches
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def bits_to_target(bits: int) -> int:
         """
         Convert the compact representation of the target (bits) to the full target value.
 
@@ -93,12 +189,11 @@ class BlockAnalyzer:
         :return: The full target value
         :rtype: int
         """
-        exponent = bits >> 24
-        mantissa = bits & 0xFFFFFF
-        target = mantissa * (1 << (8 * (exponent - 3)))
-        return target
+        return _SHIFT_CACHE[bits >> 24] * (bits & 0xFFFFFF)
 
-    def bits_to_difficulty(self, bits: int) -> float:
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def bits_to_difficulty(bits: int) -> float:
         """
         Convert the compact representation of the target (bits) to the difficulty.
 
@@ -107,9 +202,22 @@ class BlockAnalyzer:
         :return: The difficulty
         :rtype: float
         """
-        target = self.bits_to_target(bits)
-        difficulty = 0xFFFF * 256 ** (0x1D - 3) / target
-        return difficulty
+        return MAX_TARGET / BlockAnalyzer.bits_to_target(bits)
+
+    def bits_to_difficulty_array(self, bits: np.ndarray) -> np.ndarray:
+        """
+        Convert an array of compact targets (bits) to their difficulties at once.
+
+        The target is computed in float64, which holds any real network target.
+
+        :param bits: The compact representations of the targets
+        :type bits: np.ndarray
+        :return: The difficulties
+        :rtype: np.ndarray
+        """
+        exponent = (bits >> 24).astype(np.int64)
+        mantissa = (bits & 0xFFFFFF).astype(np.float64)
+        return _MAX_TARGET_F / np.ldexp(mantissa, 8 * (exponent - 3))
 
     def analyze_block_difficulty(
         self, blocks: list[dict[str, Any]]
@@ -117,34 +225,69 @@ class BlockAnalyzer:
         """
         Analyze the difficulty of a list of blocks and add the difficulty information to each block.
 
+        The blocks are put in height order when all of them have a height,
+        otherwise they must already be in chronological order (oldest first).
+        The trend is the sign of the least squares slope over that order.
+
         :param blocks: A list of blocks to analyze
         :type blocks: list[dict[str, Any]]
         :return: A list of blocks with added difficulty information
         :rtype: list[dict[str, Any]]
         """
 
-        difficulties = []
+        blocks = _chronological(blocks)
 
+        # The difficulty bitcoind already computed is used when the block has it,
+        # bits are only converted for raw headers
+        values: list[float] = []
+        # Positions and bits of the blocks without a difficulty
+        positions: list[int] = []
+        missing: list[int] = []
         for block in blocks:
-            bits = block.get("bits", 0)
-            if bits is not None:
-                difficulties.append(self.bits_to_difficulty(bits))
+            difficulty = block.get("difficulty")
+            if difficulty is None:
+                bits = block.get("bits")
+                if bits is None:
+                    continue
+                positions.append(len(values))
+                missing.append(_bits_value(bits))
+                difficulty = 0.0
+            values.append(difficulty)
+
+        difficulties = np.array(values, dtype=np.float64)
+        if len(missing) >= _VECTORIZE_MIN_BLOCKS:
+            difficulties[positions] = self.bits_to_difficulty_array(
+                np.array(missing, dtype=np.uint32)
+            )
+        elif missing:
+            difficulties[positions] = [self.bits_to_difficulty(b) for b in missing]
+
+        count = difficulties.size
+        if not count:
+            return {
+                "current_difficulty": None,
+                "average_difficulty": None,
+                "min_difficulty": None,
+                "max_difficulty": None,
+                "trend": "stable",
+                "difficulties_range": None,
+            }
+
+        low = float(difficulties.min())
+        high = float(difficulties.max())
+
+        trend = "stable"
+        if low != high:
+            slope = np.polyfit(np.arange(count), difficulties, 1)[0]
+            trend = "increasing" if slope > 0 else "decreasing"
 
         return {
-            "current_difficulty": difficulties[0] if difficulties else None,
-            "average_difficulty": sum(difficulties) / len(difficulties)
-            if difficulties
-            else None,
-            "min_difficulty": min(difficulties) if difficulties else None,
-            "max_difficulty": max(difficulties) if difficulties else None,
-            "trend": "increasing"
-            if len(difficulties) > 1 and difficulties[-1] > difficulties[0]
-            else "decreasing"
-            if len(difficulties) > 1 and difficulties[-1] < difficulties[0]
-            else "stable",
-            "difficulties_range": (min(difficulties), max(difficulties))
-            if difficulties
-            else None,
+            "current_difficulty": float(difficulties[-1]),
+            "average_difficulty": float(difficulties.mean()),
+            "min_difficulty": low,
+            "max_difficulty": high,
+            "trend": trend,
+            "difficulties_range": (low, high),
         }
 
     def analyze_mining_time(
@@ -153,23 +296,34 @@ class BlockAnalyzer:
         """
         Analyze the mining time of a list of blocks and add the mining time information to each block.
 
+        The mining time of a block is the time elapsed since its parent, so
+        the blocks are put in height order when all of them have a height,
+        otherwise they must already be in chronological order (oldest first).
+
         :param blocks: A list of blocks to analyze
         :type blocks: list[dict[str, Any]]
         :return: A list of blocks with added mining time information
         :rtype: list[dict[str, Any]]
         """
 
-        mining_times = []
-
-        for block in blocks:
-            time = block.get("time", 0)
-            if time is not None:
-                mining_times.append(time)
+        times = np.fromiter(
+            (
+                time
+                for time in (block.get("time") for block in _chronological(blocks))
+                if time is not None
+            ),
+            dtype=np.int64,
+        )
+        if times.size < 2:
+            return {
+                "average_mining_time": None,
+                "slowest_mining_time": None,
+                "fastest_mining_time": None,
+            }
 
+        deltas = np.diff(times)
         return {
-            "average_mining_time": sum(mining_times) / len(mining_times)
-            if mining_times
-            else None,
-            "slowest_mining_time": min(mining_times) if mining_times else None,
-            "fastest_mining_time": max(mining_times) if mining_times else None,
+            "average_mining_time": float(deltas.mean()),
+            "slowest_mining_time": int(deltas.max()),
+            "fastest_mining_time": int(deltas.min()),
         }